@@ -14,11 +14,12 @@
 # IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
 
-import math
+import contextlib
+import io
 import mmap
-from abc import ABC, abstractmethod
-from struct import pack, unpack
-from typing import IO, Any, Literal
+from collections.abc import Callable
+from struct import Struct
+from typing import IO, Any, ClassVar, Literal, NoReturn
 
 import numpy as np
 
@@ -32,8 +33,20 @@ from ironsegment.xml import parse_manifest, serialize_manifest
 
 FILE_MAGIC_NUMBER = 0x894972530D0A1A0A
 
+_U64BE = Struct(">Q")
+_U32BE = Struct(">L")
+_VERSION = Struct(">LL")
+_SEC_HDR = Struct(">QQ")
+_FILE_HDR = Struct(">QLL")
+
+_FILE_MAGIC_BYTES = _U64BE.pack(FILE_MAGIC_NUMBER)
+
+
+class FileReadableSection1:
+    __slots__ = ("_map", "_offset", "_offset_data", "_size", "_type")
+
+    name: ClassVar[str]
 
-class FileReadableSection1(ABC):
     def __init__(
         self, data_map: mmap.mmap, section_type: int, offset: int, size: int
     ):
@@ -43,10 +56,6 @@ class FileReadableSection1(ABC):
         self._offset_data = offset + 16
         self._size = size
 
-    @abstractmethod
-    def name(self) -> str:
-        pass
-
     @property
     def mapped_data(self) -> mmap.mmap:
         return self._map
@@ -68,8 +77,9 @@ SECTION_IDENTIFIER_MANIFEST = 0x4972_535F_4D4E_4946
 
 
 class FileReadableSection1Manifest(FileReadableSection1):
-    def name(self) -> str:
-        return "MANIFEST"
+    __slots__ = ("_manifest", "_manifest_validated")
+
+    name = "MANIFEST"
 
     def __init__(self, data_map: mmap.mmap, offset: int, size: int):
         super().__init__(
@@ -78,24 +88,32 @@ class FileReadableSection1Manifest(FileReadableSection1):
             offset=offset,
             size=size,
         )
+        self._manifest: Manifest | None = None
+        self._manifest_validated = False
+
+    def manifest(self, *, validate: bool = True) -> Manifest:
+        if self._manifest is not None and (
+            self._manifest_validated or not validate
+        ):
+            return self._manifest
 
-    def manifest(self) -> Manifest:
         manifest_start = self.data_offset + 4
-        data_size = unpack(
-            ">L", self.mapped_data[self.data_offset : manifest_start]
-        )[0]
+        data_size = _U32BE.unpack_from(self.mapped_data, self.data_offset)[0]
         manifest_data = self.mapped_data[
             manifest_start : manifest_start + data_size
         ]
-        return parse_manifest(manifest_data)
+        self._manifest = parse_manifest(manifest_data, validate=validate)
+        self._manifest_validated = validate
+        return self._manifest
 
 
 SECTION_IDENTIFIER_END = 0x4972_535F_454E_4421
 
 
 class FileReadableSection1End(FileReadableSection1):
-    def name(self) -> str:
-        return "END"
+    __slots__ = ()
+
+    name = "END"
 
     def __init__(self, data_map: mmap.mmap, offset: int, size: int):
         super().__init__(
@@ -110,8 +128,9 @@ SECTION_IDENTIFIER_IMAGE = 0x4972_535F_494D_4744
 
 
 class FileReadableSection1Image(FileReadableSection1):
-    def name(self) -> str:
-        return "IMAGE"
+    __slots__ = ()
+
+    name = "IMAGE"
 
     def __init__(self, data_map: mmap.mmap, offset: int, size: int):
         super().__init__(
@@ -122,8 +141,44 @@ class FileReadableSection1Image(FileReadableSection1):
         )
 
     def image_id(self) -> ImageID:
-        id_buffer = self.mapped_data[self.data_offset : self.data_offset + 4]
-        return ImageID(unpack(">L", id_buffer)[0])
+        return ImageID(
+            _U32BE.unpack_from(self.mapped_data, self.data_offset)[0]
+        )
+
+
+_SECTION_CLASSES: dict[
+    int, Callable[[mmap.mmap, int, int], FileReadableSection1]
+] = {
+    SECTION_IDENTIFIER_MANIFEST: FileReadableSection1Manifest,
+    SECTION_IDENTIFIER_END: FileReadableSection1End,
+    SECTION_IDENTIFIER_IMAGE: FileReadableSection1Image,
+}
+
+
+_RGBA_CHANNELS = 4
+
+_PIXEL_FORMATS: dict[ImageSemantic, tuple[int, float]] = {
+    ImageSemantic.DENOISE_RGB16: (3, 65536.0),
+    ImageSemantic.DENOISE_RGB8: (3, 256.0),
+    ImageSemantic.DENOISE_RGBA16: (4, 65536.0),
+    ImageSemantic.DENOISE_RGBA8: (4, 256.0),
+    ImageSemantic.DEPTH_16: (1, 65536.0),
+    ImageSemantic.DEPTH_32: (1, 4294967296.0),
+    ImageSemantic.MONOCHROME_LINES_8: (1, 256.0),
+    ImageSemantic.OBJECT_ID_32: (1, 4294967296.0),
+}
+
+
+_DTYPES: dict[ImageSemantic, np.dtype[Any]] = {
+    ImageSemantic.DENOISE_RGB16: np.dtype(">u2"),
+    ImageSemantic.DENOISE_RGB8: np.dtype("B"),
+    ImageSemantic.DENOISE_RGBA16: np.dtype(">u2"),
+    ImageSemantic.DENOISE_RGBA8: np.dtype("B"),
+    ImageSemantic.DEPTH_16: np.dtype(">u2"),
+    ImageSemantic.DEPTH_32: np.dtype(">u4"),
+    ImageSemantic.MONOCHROME_LINES_8: np.dtype("B"),
+    ImageSemantic.OBJECT_ID_32: np.dtype(">u4"),
+}
 
 
 class ImageReadable1:
@@ -138,177 +193,160 @@ class ImageReadable1:
         self._height = height
         self._semantic = semantic
         self._data = data
+        self._channels, self._range = _PIXEL_FORMATS[semantic]
+        self._has_alpha = self._channels == _RGBA_CHANNELS
+        self._is_object_id = semantic == ImageSemantic.OBJECT_ID_32
+        self._scale = 1.0 / self._range
 
     @property
     def semantic(self) -> ImageSemantic:
         return self._semantic
 
-    def get_object_id(self, x: int, y: int) -> np.uint32:
-        if x >= self._width:
+    def _raise_bounds(self, x: int, y: int) -> NoReturn:
+        if x < 0:
+            _error = f"X component {x} < 0"
+        elif x >= self._width:
             _error = f"X component {x} >= {self._width}"
-            raise ValueError(_error)
-        if y >= self._height:
+        elif y < 0:
+            _error = f"Y component {y} < 0"
+        else:
             _error = f"Y component {y} >= {self._height}"
-            raise ValueError(_error)
-
-        if self.semantic == ImageSemantic.OBJECT_ID_32:
-            _index = (y * self._width) + x
-            return np.uint32(self._data[_index])
+        raise ValueError(_error)
 
-        _error = f"Cannot fetch object IDs from image with {self.semantic}"
+    def _raise_not_object_id(self) -> NoReturn:
+        _error = f"Cannot fetch object IDs from image with {self.semantic.name}"
         raise ValueError(_error)
 
+    def get_object_id(self, x: int, y: int) -> np.uint32:
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            self._raise_bounds(x, y)
+        if not self._is_object_id:
+            self._raise_not_object_id()
+
+        _index = (y * self._width) + x
+        return np.uint32(self._data[_index])
+
+    def get_object_id_array(self) -> np.ndarray[Any, np.dtype[np.uint32]]:
+        if not self._is_object_id:
+            self._raise_not_object_id()
+
+        _ids = self._pixels()[:, :, 0]
+        _ids.flags.writeable = False
+        return _ids
+
+    def _pixel(self, x: int, y: int) -> np.ndarray[Any, Any]:
+        _index = ((y * self._width) + x) * self._channels
+        return self._data[_index : _index + self._channels]
+
     def get_rgb_float(
         self, x: int, y: int
     ) -> np.ndarray[Literal[3], np.dtype[np.float64]]:
-        if x >= self._width:
-            _error = f"X component {x} >= {self._width}"
-            raise ValueError(_error)
-        if y >= self._height:
-            _error = f"Y component {y} >= {self._height}"
-            raise ValueError(_error)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            self._raise_bounds(x, y)
 
-        _index: int
-        match self.semantic:
-            case ImageSemantic.OBJECT_ID_32:
-                _index = (y * self._width) + x
-                _oid32: np.uint32 = self._data[_index]
-                _out = np.full(3, _oid32, dtype=np.float64)
-                return np.divide(_out, 4294967296.0)
-
-            case ImageSemantic.DEPTH_16:
-                _index = (y * self._width) + x
-                _u16: np.uint16 = self._data[_index]
-                _out = np.full(3, _u16, dtype=np.float64)
-                return np.divide(_out, 65536.0)
-
-            case ImageSemantic.DEPTH_32:
-                _index = (y * self._width) + x
-                _u32: np.uint32 = self._data[_index]
-                _out = np.full(3, _u32, dtype=np.float64)
-                return np.divide(_out, 4294967296.0)
-
-            case ImageSemantic.DENOISE_RGB8:
-                _index = (y * self._width * 3) + (x * 3)
-                _rgbu8: np.ndarray[Literal[3], np.dtype[np.uint8]]
-                _rgbu8 = self._data[_index : _index + 3]
-                return np.divide(_rgbu8, 256.0)
-
-            case ImageSemantic.DENOISE_RGBA8:
-                _index = (y * self._width * 4) + (x * 4)
-                _rgbau8: np.ndarray[Literal[3], np.dtype[np.uint8]]
-                _rgbau8 = self._data[_index : _index + 3]
-                return np.divide(_rgbau8, 256.0)
-
-            case ImageSemantic.DENOISE_RGBA16:
-                _index = (y * self._width * 4) + (x * 4)
-                _rgbau16: np.ndarray[Literal[3], np.dtype[np.uint16]]
-                _rgbau16 = self._data[_index : _index + 3]
-                return np.divide(_rgbau16, 65536.0)
-
-            case ImageSemantic.DENOISE_RGB16:
-                _index = (y * self._width * 3) + (x * 3)
-                _rgba16: np.ndarray[Literal[3], np.dtype[np.uint16]]
-                _rgba16 = self._data[_index : _index + 3]
-                return np.divide(_rgba16, 65536.0)
-
-            case ImageSemantic.MONOCHROME_LINES_8:
-                _index = (y * self._width) + x
-                _u8: np.uint8 = self._data[_index]
-                _out = np.full(3, _u8, dtype=np.float64)
-                return np.divide(_out, 256.0)
+        _out = np.empty(3, dtype=np.float64)
+        _out[0:3] = self._pixel(x, y)[0:3]
+        return np.multiply(_out, self._scale, out=_out)
 
     def get_rgba_float(
         self, x: int, y: int
     ) -> np.ndarray[Literal[3], np.dtype[np.float64]]:
-        if x >= self._width:
-            _error = f"X component {x} >= {self._width}"
-            raise ValueError(_error)
-        if y >= self._height:
-            _error = f"Y component {y} >= {self._height}"
-            raise ValueError(_error)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            self._raise_bounds(x, y)
+
+        _pixel = self._pixel(x, y)
+        _out = np.empty(4, dtype=np.float64)
+        _out[0:3] = _pixel[0:3]
+        _out[3] = _pixel[3] if self._has_alpha else self._range
+        return np.multiply(_out, self._scale, out=_out)
+
+    def _pixels(self) -> np.ndarray[Any, Any]:
+        _count = self._width * self._height * self._channels
+        return self._data[0:_count].reshape(
+            self._height, self._width, self._channels
+        )
 
-        _index: int
-        match self.semantic:
-            case ImageSemantic.OBJECT_ID_32:
-                _index = (y * self._width) + x
-                _oid32: np.uint32 = self._data[_index]
-                _out = np.full(4, _oid32, dtype=np.float64)
-                _out[3] = 4294967296
-                return np.divide(_out, 4294967296.0)
-
-            case ImageSemantic.DEPTH_16:
-                _index = (y * self._width) + x
-                _u16: np.uint16 = self._data[_index]
-                _out = np.full(4, _u16, dtype=np.float64)
-                _out[3] = 65536
-                return np.divide(_out, 65536.0)
-
-            case ImageSemantic.DEPTH_32:
-                _index = (y * self._width) + x
-                _u32: np.uint32 = self._data[_index]
-                _out = np.full(4, _u32, dtype=np.float64)
-                _out[3] = 4294967296
-                return np.divide(_out, 4294967296.0)
-
-            case ImageSemantic.DENOISE_RGB8:
-                _index = (y * self._width * 3) + (x * 3)
-                _out_rgb8: np.ndarray[Literal[4], np.dtype[np.uint8]]
-                _out_rgb8 = np.full(4, 1.0, dtype=np.float64)
-                _out_rgb8[0:3] = self._data[_index : _index + 3]
-                _out_rgb8[3] = 256.0
-                return np.divide(_out_rgb8, 256.0)
-
-            case ImageSemantic.DENOISE_RGBA8:
-                _index = (y * self._width * 4) + (x * 4)
-                _out_rgba8: np.ndarray[Literal[4], np.dtype[np.uint8]]
-                _out_rgba8 = self._data[_index : _index + 4]
-                return np.divide(_out_rgba8, 256.0)
-
-            case ImageSemantic.DENOISE_RGBA16:
-                _index = (y * self._width * 4) + (x * 4)
-                _out_rgba16: np.ndarray[Literal[4], np.dtype[np.uint16]]
-                _out_rgba16 = self._data[_index : _index + 4]
-                return np.divide(_out_rgba16, 65536.0)
-
-            case ImageSemantic.DENOISE_RGB16:
-                _index = (y * self._width * 3) + (x * 3)
-                _out_rgb16: np.ndarray[Literal[4], np.dtype[np.uint16]]
-                _out_rgb16 = np.full(4, 1.0, dtype=np.float64)
-                _out_rgb16[0:3] = self._data[_index : _index + 3]
-                _out_rgb16[3] = 65536.0
-                return np.divide(_out_rgb16, 65536.0)
-
-            case ImageSemantic.MONOCHROME_LINES_8:
-                _index = (y * self._width) + x
-                _u8: np.uint8 = self._data[_index]
-                _out_l8 = np.full(4, _u8, dtype=np.float64)
-                _out_l8[3] = 256.0
-                return np.divide(_out_l8, 256.0)
+    def get_rgb_float_array(
+        self,
+    ) -> np.ndarray[Any, np.dtype[np.float64]]:
+        _out = np.empty((self._height, self._width, 3), dtype=np.float64)
+        _out[:, :, 0:3] = self._pixels()[:, :, 0:3]
+        return np.multiply(_out, self._scale, out=_out)
+
+    def get_rgba_float_array(
+        self,
+    ) -> np.ndarray[Any, np.dtype[np.float64]]:
+        _pixels = self._pixels()
+        _out = np.empty((self._height, self._width, 4), dtype=np.float64)
+        _out[:, :, 0:3] = _pixels[:, :, 0:3]
+        if self._has_alpha:
+            _out[:, :, 3] = _pixels[:, :, 3]
+        else:
+            _out[:, :, 3] = self._range
+        return np.multiply(_out, self._scale, out=_out)
+
+
+def _native_array(
+    data_map: mmap.mmap, dtype: np.dtype[Any], start: int, end: int
+) -> np.ndarray[Any, Any]:
+    data = np.frombuffer(
+        buffer=data_map,
+        dtype=dtype,
+        count=(end - start) // dtype.itemsize,
+        offset=start,
+    )
+    return data.astype(dtype.newbyteorder("="), copy=True)
+
+
+def _advise(
+    data_map: mmap.mmap, advice_name: str, start: int = 0, length: int = -1
+) -> None:
+    advice = getattr(mmap, advice_name, None)
+    if advice is None:
+        return
+    if length < 0:
+        length = len(data_map) - start
+    page_start = start - (start % mmap.PAGESIZE)
+    with contextlib.suppress(OSError):
+        data_map.madvise(advice, page_start, length + (start - page_start))
 
 
 class FileReadable1:
     @classmethod
-    def open_file(cls, path: str) -> "FileReadable1":
+    def open_file(
+        cls, path: str, *, preload: bool = False, validate: bool = True
+    ) -> "FileReadable1":
         f = open(path, "rb")
-        mm = mmap.mmap(fileno=f.fileno(), length=0, access=mmap.ACCESS_READ)
-        cls.check_magic_number(mm)
-        (version_major, version_minor) = cls.check_version(mm)
-        manifest_section, sections = cls.enumerate_sections(mm)
-        manifest = manifest_section.manifest()
-        return FileReadable1(
-            file=f,
-            mm=mm,
-            version_major=version_major,
-            version_minor=version_minor,
-            manifest=manifest,
-            sections=sections,
-        )
+        try:
+            mm = mmap.mmap(fileno=f.fileno(), length=0, access=mmap.ACCESS_READ)
+        except BaseException:
+            f.close()
+            raise
+
+        try:
+            _advise(mm, "MADV_WILLNEED" if preload else "MADV_SEQUENTIAL")
+            cls.check_magic_number(mm)
+            (version_major, version_minor) = cls.check_version(mm)
+            manifest_section, section_index = cls.enumerate_sections(mm)
+            manifest_section.manifest(validate=validate)
+            _advise(mm, "MADV_RANDOM")
+            return FileReadable1(
+                file=f,
+                mm=mm,
+                version_major=version_major,
+                version_minor=version_minor,
+                manifest_section=manifest_section,
+                section_index=section_index,
+                validate=validate,
+            )
+        except BaseException:
+            mm.close()
+            f.close()
+            raise
 
     @classmethod
     def check_version(cls, mm: mmap.mmap) -> tuple[int, int]:
-        version_major = unpack(">L", mm[8:12])[0]
-        version_minor = unpack(">L", mm[12:16])[0]
+        version_major, version_minor = _VERSION.unpack_from(mm, 8)
         version_major_expected = 1
         if version_major != 1:
             _error = f"File major version {version_major} \
@@ -318,38 +356,32 @@ class FileReadable1:
 
     @classmethod
     def check_magic_number(cls, mm: mmap.mmap) -> None:
-        magic_expected = FILE_MAGIC_NUMBER
-        magic = unpack(">Q", mm[0:8])[0]
-        if magic != magic_expected:
+        magic_bytes = mm[0:8]
+        if magic_bytes != _FILE_MAGIC_BYTES:
+            magic_expected = FILE_MAGIC_NUMBER
+            magic = int.from_bytes(magic_bytes, "big")
             _error = f"File magic number {magic} should be {magic_expected}"
             raise ValueError(_error)
 
     @classmethod
     def enumerate_sections(
         cls, mm: mmap.mmap
-    ) -> tuple[FileReadableSection1Manifest, list[FileReadableSection1]]:
+    ) -> tuple[FileReadableSection1Manifest, list[tuple[int, int, int]]]:
         offset = 16
-        sections: list[FileReadableSection1] = []
+        section_index: list[tuple[int, int, int]] = []
         manifest_section: FileReadableSection1Manifest | None = None
 
         while True:
-            section_type_buffer = mm[offset : offset + 8]
-            section_size_buffer = mm[offset + 8 : offset + 16]
-            section_type: int = unpack(">Q", section_type_buffer)[0]
-            section_size: int = unpack(">Q", section_size_buffer)[0]
+            section_type: int
+            section_size: int
+            section_type, section_size = _SEC_HDR.unpack_from(mm, offset)
             if section_type == SECTION_IDENTIFIER_MANIFEST:
                 manifest_section = FileReadableSection1Manifest(
                     mm, offset, section_size
                 )
-                sections.append(manifest_section)
-            elif section_type == SECTION_IDENTIFIER_IMAGE:
-                sections.append(
-                    FileReadableSection1Image(mm, offset, section_size)
-                )
-            elif section_type == SECTION_IDENTIFIER_END:
-                sections.append(
-                    FileReadableSection1End(mm, offset, section_size)
-                )
+            if section_type in _SECTION_CLASSES:
+                section_index.append((section_type, offset, section_size))
+            if section_type == SECTION_IDENTIFIER_END:
                 break
             offset = offset + 16
             offset = offset + section_size
@@ -358,7 +390,7 @@ class FileReadable1:
             _error = "File is missing a manifest section."
             raise ValueError(_error)
 
-        return manifest_section, sections
+        return manifest_section, section_index
 
     def __init__(
         self,
@@ -366,15 +398,24 @@ class FileReadable1:
         mm: mmap.mmap,
         version_major: int,
         version_minor: int,
-        manifest: Manifest,
-        sections: list[FileReadableSection1],
+        manifest_section: FileReadableSection1Manifest,
+        section_index: list[tuple[int, int, int]],
+        *,
+        validate: bool = True,
     ):
         self._file = file
         self._map = mm
         self._version_major = version_major
         self._version_minor = version_minor
-        self._manifest = manifest
-        self._sections = sections
+        self._manifest_section = manifest_section
+        self._manifest = manifest_section.manifest(validate=validate)
+        self._section_index = section_index
+        self._sections: list[FileReadableSection1] | None = None
+        self._image_offsets: dict[int, tuple[int, int]] = {}
+        for section_type, offset, size in section_index:
+            if section_type == SECTION_IDENTIFIER_IMAGE:
+                image_id = _U32BE.unpack_from(mm, offset + 16)[0]
+                self._image_offsets.setdefault(image_id, (offset, size))
 
     def __enter__(self) -> "FileReadable1":
         return self
@@ -395,98 +436,41 @@ class FileReadable1:
 
     @property
     def sections(self) -> list[FileReadableSection1]:
+        if self._sections is None:
+            self._sections = [
+                self._section(section_type, offset, size)
+                for section_type, offset, size in self._section_index
+            ]
         return self._sections
 
+    def _section(
+        self, section_type: int, offset: int, size: int
+    ) -> FileReadableSection1:
+        if offset == self._manifest_section.file_offset:
+            return self._manifest_section
+        return _SECTION_CLASSES[section_type](self._map, offset, size)
+
     def image_section(self, image_id: ImageID) -> FileReadableSection1Image:
-        for section in self._sections:
-            if (
-                isinstance(section, FileReadableSection1Image)
-                and section.image_id().value == image_id.value
-            ):
-                return section
-
-        _error = "No such image section"
-        raise ValueError(_error)
+        location = self._image_offsets.get(image_id.value)
+        if location is None:
+            _error = "No such image section"
+            raise ValueError(_error)
+        offset, size = location
+        return FileReadableSection1Image(self._map, offset, size)
 
     def image_data(self, image_id: ImageID) -> ImageReadable1:
         section = self.image_section(image_id)
         semantic = self._manifest.images.images[image_id.value].semantic
         a_start = section.data_offset + 4
         a_end = a_start + section.size
+        _advise(self._map, "MADV_WILLNEED", a_start, a_end - a_start)
 
-        match semantic:
-            case ImageSemantic.OBJECT_ID_32:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype(">u4")
-                    ),
-                )
-            case ImageSemantic.DEPTH_16:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype(">u2")
-                    ),
-                )
-            case ImageSemantic.DEPTH_32:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype(">u4")
-                    ),
-                )
-            case ImageSemantic.DENOISE_RGB8:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype("B")
-                    ),
-                )
-            case ImageSemantic.DENOISE_RGBA8:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype("B")
-                    ),
-                )
-            case ImageSemantic.DENOISE_RGBA16:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype(">u2")
-                    ),
-                )
-            case ImageSemantic.DENOISE_RGB16:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype(">u2")
-                    ),
-                )
-            case ImageSemantic.MONOCHROME_LINES_8:
-                return ImageReadable1(
-                    semantic=semantic,
-                    width=self._manifest.images.width,
-                    height=self._manifest.images.height,
-                    data=np.frombuffer(
-                        buffer=self._map[a_start:a_end], dtype=np.dtype("B")
-                    ),
-                )
+        return ImageReadable1(
+            semantic=semantic,
+            width=self._manifest.images.width,
+            height=self._manifest.images.height,
+            data=_native_array(self._map, _DTYPES[semantic], a_start, a_end),
+        )
 
 
 class ImageWritable1:
@@ -511,45 +495,40 @@ class ImageWritable1:
 class FileWritable1:
     @staticmethod
     def _aligned_size(size: int) -> int:
-        return int(math.ceil(size / 16.0) * 16)
+        return (size + 15) & ~15
 
     @classmethod
     def open_file(cls, path: str, manifest: Manifest) -> "FileWritable1":
         f = open(path, "w+b")
         f.truncate(0)
-        f.write(pack(">Q", FILE_MAGIC_NUMBER))
-        f.write(pack(">L", 1))
-        f.write(pack(">L", 0))
+        f.write(_FILE_HDR.pack(FILE_MAGIC_NUMBER, 1, 0))
 
         section_data = serialize_manifest(manifest)
         section_size = FileWritable1._aligned_size(len(section_data))
 
-        f.write(pack(">Q", SECTION_IDENTIFIER_MANIFEST))
-        f.write(pack(">Q", section_size))
+        f.write(_SEC_HDR.pack(SECTION_IDENTIFIER_MANIFEST, section_size))
         f.write(section_data)
         f.write(bytes(section_size - len(section_data)))
-        f.flush()
 
+        offset = _FILE_HDR.size + _SEC_HDR.size + section_size
         writable_images: list[ImageWritable1] = []
         for i in sorted(manifest.images.images):
             image = manifest.images.images[i]
             size = pixel_size_for_semantic(image.semantic)
             total_size = manifest.images.width * manifest.images.height * size
             aligned_size = FileWritable1._aligned_size(total_size)
-            f.write(pack(">Q", SECTION_IDENTIFIER_IMAGE))
-            f.write(pack(">Q", aligned_size))
-            f.flush()
-            offset = f.tell()
-            for _ in range(aligned_size):
-                f.write(bytes(1))
+            f.write(_SEC_HDR.pack(SECTION_IDENTIFIER_IMAGE, aligned_size))
+            f.seek(aligned_size, io.SEEK_CUR)
+            offset = offset + _SEC_HDR.size
             writable_images.append(
                 ImageWritable1(
                     semantic=image.semantic, offset=offset, size=total_size
                 )
             )
+            offset = offset + aligned_size
 
-        f.write(pack(">Q", SECTION_IDENTIFIER_END))
-        f.write(pack(">Q", 0))
+        f.write(_SEC_HDR.pack(SECTION_IDENTIFIER_END, 0))
+        f.flush()
 
         mm = mmap.mmap(fileno=f.fileno(), length=0, access=mmap.ACCESS_WRITE)
         return FileWritable1(
@@ -15,19 +15,19 @@
 #
 
 from collections.abc import Mapping
-from enum import Enum
+from enum import IntEnum
 
 MAX_ID_VALUE_INCLUSIVE = 4294967295
 
 
 class ObjectID:
+    __slots__ = ("_value",)
+
     _value: int
 
     def __init__(self, value: int):
-        _error = f"IDs must be in the range [1, {MAX_ID_VALUE_INCLUSIVE}]"
-        if not value >= 1:
-            raise ValueError(_error)
-        if not value <= MAX_ID_VALUE_INCLUSIVE:
+        if not 1 <= value <= MAX_ID_VALUE_INCLUSIVE:
+            _error = f"IDs must be in the range [1, {MAX_ID_VALUE_INCLUSIVE}]"
             raise ValueError(_error)
         self._value = value
 
@@ -37,13 +37,13 @@ class ObjectID:
 
 
 class ImageID:
+    __slots__ = ("_value",)
+
     _value: int
 
     def __init__(self, value: int):
-        _error = f"IDs must be in the range [1, {MAX_ID_VALUE_INCLUSIVE}]"
-        if not value >= 1:
-            raise ValueError(_error)
-        if not value <= MAX_ID_VALUE_INCLUSIVE:
+        if not 1 <= value <= MAX_ID_VALUE_INCLUSIVE:
+            _error = f"IDs must be in the range [1, {MAX_ID_VALUE_INCLUSIVE}]"
             raise ValueError(_error)
         self._value = value
 
@@ -52,7 +52,7 @@ class ImageID:
         return self._value
 
 
-class ImageSemantic(Enum):
+class ImageSemantic(IntEnum):
     DENOISE_RGB16 = 0
     DENOISE_RGB8 = 1
     DENOISE_RGBA16 = 2
@@ -84,6 +84,8 @@ def pixel_size_for_semantic(semantic: ImageSemantic) -> int:
 
 
 class Image:
+    __slots__ = ("_identifier", "_semantic")
+
     _identifier: ImageID
     _semantic: ImageSemantic
 
@@ -101,6 +103,8 @@ class Image:
 
 
 class Object:
+    __slots__ = ("_description", "_identifier")
+
     _identifier: ObjectID
     _description: str
 
@@ -118,6 +122,8 @@ class Object:
 
 
 class Images:
+    __slots__ = ("_height", "_images", "_width")
+
     _width: int
     _height: int
     _images: Mapping[int, Image]
@@ -141,6 +147,8 @@ class Images:
 
 
 class Manifest:
+    __slots__ = ("_images", "_metadata", "_objects")
+
     _images: Images
     _objects: Mapping[int, Object]
     _metadata: Mapping[str, str]
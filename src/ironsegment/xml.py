@@ -15,8 +15,11 @@
 #
 
 
+import functools
+import threading
 from collections.abc import Mapping
 from importlib import resources as import_resources
+from operator import itemgetter
 
 from lxml import etree
 from lxml.etree import XMLSchema, _Element
@@ -35,6 +38,16 @@ NAMESPACE_1 = "urn:com.io7m.ironsegment:manifest:1"
 
 NS_MAP: Mapping[str, str] = {None: NAMESPACE_1}  # type: ignore
 
+TAG_MANIFEST = f"{{{NAMESPACE_1}}}Manifest"
+TAG_IMAGES = f"{{{NAMESPACE_1}}}Images"
+TAG_IMAGE = f"{{{NAMESPACE_1}}}Image"
+TAG_OBJECTS = f"{{{NAMESPACE_1}}}Objects"
+TAG_OBJECT = f"{{{NAMESPACE_1}}}Object"
+TAG_METADATA = f"{{{NAMESPACE_1}}}Metadata"
+TAG_META = f"{{{NAMESPACE_1}}}Meta"
+
+_PARSERS = threading.local()
+
 
 def schema_bytes() -> bytes:
     path = import_resources.files("ironsegment") / "manifest-1.xsd"
@@ -42,25 +55,40 @@ def schema_bytes() -> bytes:
         return f.read()
 
 
+@functools.cache
 def schema() -> XMLSchema:
     schema_root = etree.XML(schema_bytes())
     return etree.XMLSchema(schema_root)
 
 
-def parse_manifest_text(text: bytes) -> _Element:
-    parser = etree.XMLParser(schema=schema(), resolve_entities=False)
+def _parser(*, validate: bool) -> etree.XMLParser:
+    key = "validating" if validate else "plain"
+    parser: etree.XMLParser | None = getattr(_PARSERS, key, None)
+    if parser is None:
+        parser = etree.XMLParser(
+            schema=schema() if validate else None,
+            resolve_entities=False,
+            no_network=True,
+            collect_ids=False,
+        )
+        setattr(_PARSERS, key, parser)
+    return parser
+
+
+def parse_manifest_text(text: bytes, *, validate: bool = True) -> _Element:
+    parser = _parser(validate=validate)
     return etree.fromstring(text, parser)
 
 
-def parse_manifest(text: bytes) -> Manifest:
-    tree = parse_manifest_text(text)
+def parse_manifest(text: bytes, *, validate: bool = True) -> Manifest:
+    tree = parse_manifest_text(text, validate=validate)
     images_tree = tree[0]
     images: dict[int, Image] = {}
     width = int(str(images_tree.get("Width")))
     height = int(str(images_tree.get("Height")))
     for e in images_tree:
         image_id = ImageID(int(str(e.get("ID"))))
-        image_semantic = ImageSemantic(ImageSemantic[(str(e.get("Semantic")))])
+        image_semantic = ImageSemantic[str(e.get("Semantic"))]
         images[image_id.value] = Image(image_id, image_semantic)
 
     objects_tree = tree[1]
@@ -81,42 +109,32 @@ def parse_manifest(text: bytes) -> Manifest:
 
 
 def serialize_manifest(manifest: Manifest) -> bytes:
-    root = etree.Element("Manifest", nsmap=NS_MAP)
+    root = etree.Element(TAG_MANIFEST, nsmap=NS_MAP)
 
-    images = etree.Element(
-        "Images",
-        nsmap=NS_MAP,
+    images = etree.SubElement(
+        root,
+        TAG_IMAGES,
         Width=str(manifest.images.width),
         Height=str(manifest.images.height),
     )
-    root.append(images)
-
-    for iid in sorted(manifest.images.images):
-        image = manifest.images.images[iid]
-        images.append(
-            etree.Element(
-                "Image",
-                nsmap=NS_MAP,
-                ID=str(image.identifier.value),
-                Semantic=image.semantic.name,
-            )
+    for _, image in sorted(manifest.images.images.items(), key=itemgetter(0)):
+        etree.SubElement(
+            images,
+            TAG_IMAGE,
+            ID=str(image.identifier.value),
+            Semantic=image.semantic.name,
         )
 
-    objects = etree.Element("Objects", nsmap=NS_MAP)
-    for oid in sorted(manifest.objects):
-        object_value = manifest.objects[oid]
-        e = etree.Element(
-            "Object", nsmap=NS_MAP, ID=str(object_value.identifier.value)
+    objects = etree.SubElement(root, TAG_OBJECTS)
+    for _, object_value in sorted(manifest.objects.items(), key=itemgetter(0)):
+        e = etree.SubElement(
+            objects, TAG_OBJECT, ID=str(object_value.identifier.value)
         )
         e.text = object_value.description
-        objects.append(e)
-    root.append(objects)
 
-    metadata = etree.Element("Metadata", nsmap=NS_MAP)
-    for name in sorted(manifest.metadata):
-        e = etree.Element("Meta", nsmap=NS_MAP, Name=name)
-        e.text = manifest.metadata[name]
-        metadata.append(e)
+    metadata = etree.SubElement(root, TAG_METADATA)
+    for name, value in sorted(manifest.metadata.items(), key=itemgetter(0)):
+        e = etree.SubElement(metadata, TAG_META, Name=name)
+        e.text = value
 
-    root.append(metadata)
     return etree.tostring(root)
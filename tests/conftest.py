@@ -13,3 +13,70 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF OR
 # IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
+
+import os
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from ironsegment.binary1 import FileReadable1
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+_OPEN_STATS = {"count": 0, "ns": 0}
+
+
+def _resource_file(name: str) -> str:
+    return os.path.join(_HERE, name)
+
+
+@pytest.fixture(scope="session")
+def full_isb() -> Iterator[FileReadable1]:
+    with FileReadable1.open_file(_resource_file("full.isb")) as f:
+        yield f
+
+
+@pytest.fixture(scope="session")
+def example_isb() -> Iterator[FileReadable1]:
+    with FileReadable1.open_file(_resource_file("example-0.isb")) as f:
+        yield f
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--open-stats",
+        action="store_true",
+        help="Report FileReadable1.open_file call count and time.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getoption("open_stats"):
+        return
+
+    open_file = FileReadable1.open_file.__func__
+
+    def counted(
+        cls: type[FileReadable1], path: str, **kwargs: Any
+    ) -> FileReadable1:
+        start = time.perf_counter_ns()
+        try:
+            return open_file(cls, path, **kwargs)
+        finally:
+            _OPEN_STATS["count"] += 1
+            _OPEN_STATS["ns"] += time.perf_counter_ns() - start
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(FileReadable1, "open_file", classmethod(counted))
+    config.add_cleanup(mp.undo)
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    count = _OPEN_STATS["count"]
+    if count:
+        total_ms = _OPEN_STATS["ns"] / 1_000_000
+        terminalreporter.write_line(
+            f"FileReadable1.open_file: {count} calls, {total_ms:.3f} ms"
+        )
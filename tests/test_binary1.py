@@ -14,9 +14,12 @@
 # IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
 
+import errno
 import os
 
+import numpy as np
 import pytest
+from lxml.etree import XMLSyntaxError
 
 from ironsegment.binary1 import (
     FileReadable1,
@@ -24,12 +27,31 @@ from ironsegment.binary1 import (
     FileReadableSection1Image,
     FileReadableSection1Manifest,
     FileWritable1,
+    _advise,
 )
 from ironsegment.model import ImageID, Manifest
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# Image ID, raw RGBA at (1, 0) and (31, 15), and the range of each image
+# in full.isb.
+_IMAGES = [
+    (1, [1, 2, 3, 65536], [511, 512, 513, 65536], 65536.0),
+    (2, [1, 2, 3, 256], [255, 0, 1, 256], 256.0),
+    (3, [1, 2, 3, 4], [511, 512, 513, 514], 65536.0),
+    (4, [1, 2, 3, 4], [255, 0, 1, 2], 256.0),
+    (5, [1, 1, 1, 65536], [511, 511, 511, 65536], 65536.0),
+    (6, [1, 1, 1, 4294967296], [511, 511, 511, 4294967296], 4294967296.0),
+    (7, [1, 1, 1, 256], [255, 255, 255, 256], 256.0),
+    (8, [1, 1, 1, 4294967296], [511, 511, 511, 4294967296], 4294967296.0),
+]
+
+_SAMPLES = [(0, 0), (1, 0), (2, 0), (7, 3), (31, 15)]
+
 
 def resource_file(name: str) -> str:
-    return str(os.path.dirname(os.path.abspath(__file__)) + "/" + name)
+    return os.path.join(_HERE, name)
 
 
 class TestBinary1:
@@ -47,384 +69,504 @@ class TestBinary1:
             assert isinstance(f.sections[3], FileReadableSection1Image)
             assert isinstance(f.sections[4], FileReadableSection1End)
 
-    def test_open_write(self, tmpdir) -> None:
-        with FileReadable1.open_file(resource_file("example-0.isb")) as f:
-            outfile = tmpdir + "/example-0.isb"
-            manifest = f.sections[0].manifest()
-            with FileWritable1.open_file(outfile, manifest) as w:
-                assert len(w.writable_images) == 3
-                assert w.writable_images[0].data_offset == 1248
-                assert w.writable_images[1].data_offset == 2800
-                assert w.writable_images[2].data_offset == 3840
-
-    def test_get_rgb_float_x(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(1))
-            with pytest.raises(ValueError, match="X component.*"):
-                data.get_rgb_float(1024, 0)
-
-    def test_get_rgb_float_y(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(1))
-            with pytest.raises(ValueError, match="Y component.*"):
-                data.get_rgb_float(0, 1024)
-
-    def test_get_rgba_float_x(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(1))
-            with pytest.raises(ValueError, match="X component.*"):
-                data.get_rgba_float(1024, 0)
-
-    def test_get_rgba_float_y(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(1))
-            with pytest.raises(ValueError, match="Y component.*"):
-                data.get_rgba_float(0, 1024)
-
-    def test_get_rgb_float_image1(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(1))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 1.0 / 65536.0
-            assert rgb[2] == 2.0 / 65536.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 65536.0
-            assert rgb[1] == 2.0 / 65536.0
-            assert rgb[2] == 3.0 / 65536.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 65536.0
-            assert rgb[1] == 3.0 / 65536.0
-            assert rgb[2] == 4.0 / 65536.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image2(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(2))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 1.0 / 256.0
-            assert rgb[2] == 2.0 / 256.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 256.0
-            assert rgb[1] == 2.0 / 256.0
-            assert rgb[2] == 3.0 / 256.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 256.0
-            assert rgb[1] == 3.0 / 256.0
-            assert rgb[2] == 4.0 / 256.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image3(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(3))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 1.0 / 65536.0
-            assert rgb[2] == 2.0 / 65536.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 65536.0
-            assert rgb[1] == 2.0 / 65536.0
-            assert rgb[2] == 3.0 / 65536.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 65536.0
-            assert rgb[1] == 3.0 / 65536.0
-            assert rgb[2] == 4.0 / 65536.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image4(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(4))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 1.0 / 256.0
-            assert rgb[2] == 2.0 / 256.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 256.0
-            assert rgb[1] == 2.0 / 256.0
-            assert rgb[2] == 3.0 / 256.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 256.0
-            assert rgb[1] == 3.0 / 256.0
-            assert rgb[2] == 4.0 / 256.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image5(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
+    def test_open_write(self, tmpdir, example_isb: FileReadable1) -> None:
+        outfile = tmpdir + "/example-0.isb"
+        manifest = example_isb.sections[0].manifest()
+        with FileWritable1.open_file(outfile, manifest) as w:
+            assert len(w.writable_images) == 3
+            assert w.writable_images[0].data_offset == 1248
+            assert w.writable_images[1].data_offset == 2800
+            assert w.writable_images[2].data_offset == 3840
+
+    def test_get_rgb_float_x(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        with pytest.raises(ValueError, match="X component.*"):
+            data.get_rgb_float(1024, 0)
+
+    def test_get_rgb_float_y(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        with pytest.raises(ValueError, match="Y component.*"):
+            data.get_rgb_float(0, 1024)
+
+    def test_get_rgba_float_x(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        with pytest.raises(ValueError, match="X component.*"):
+            data.get_rgba_float(1024, 0)
+
+    def test_get_rgb_float_x_negative(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        with pytest.raises(ValueError, match="X component.*"):
+            data.get_rgb_float(-1, 0)
+
+    def test_get_rgb_float_y_negative(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        with pytest.raises(ValueError, match="Y component.*"):
+            data.get_rgb_float(0, -1)
+
+    def test_get_rgba_float_y(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        with pytest.raises(ValueError, match="Y component.*"):
+            data.get_rgba_float(0, 1024)
+
+    def test_get_rgb_float_image1(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 1.0 / 65536.0
+        assert rgb[2] == 2.0 / 65536.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 65536.0
+        assert rgb[1] == 2.0 / 65536.0
+        assert rgb[2] == 3.0 / 65536.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 65536.0
+        assert rgb[1] == 3.0 / 65536.0
+        assert rgb[2] == 4.0 / 65536.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image2(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(2))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 1.0 / 256.0
+        assert rgb[2] == 2.0 / 256.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 256.0
+        assert rgb[1] == 2.0 / 256.0
+        assert rgb[2] == 3.0 / 256.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 256.0
+        assert rgb[1] == 3.0 / 256.0
+        assert rgb[2] == 4.0 / 256.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image3(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(3))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 1.0 / 65536.0
+        assert rgb[2] == 2.0 / 65536.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 65536.0
+        assert rgb[1] == 2.0 / 65536.0
+        assert rgb[2] == 3.0 / 65536.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 65536.0
+        assert rgb[1] == 3.0 / 65536.0
+        assert rgb[2] == 4.0 / 65536.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image4(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(4))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 1.0 / 256.0
+        assert rgb[2] == 2.0 / 256.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 256.0
+        assert rgb[1] == 2.0 / 256.0
+        assert rgb[2] == 3.0 / 256.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 256.0
+        assert rgb[1] == 3.0 / 256.0
+        assert rgb[2] == 4.0 / 256.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image5(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(5))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 0.00000000
+        assert rgb[2] == 0.00000000
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 65536.0
+        assert rgb[1] == 1.0 / 65536.0
+        assert rgb[2] == 1.0 / 65536.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 65536.0
+        assert rgb[1] == 2.0 / 65536.0
+        assert rgb[2] == 2.0 / 65536.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image6(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(6))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 0.00000000
+        assert rgb[2] == 0.00000000
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 4294967296.0
+        assert rgb[1] == 1.0 / 4294967296.0
+        assert rgb[2] == 1.0 / 4294967296.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 4294967296.0
+        assert rgb[1] == 2.0 / 4294967296.0
+        assert rgb[2] == 2.0 / 4294967296.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image7(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(7))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 0.00000000
+        assert rgb[2] == 0.00000000
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 256.0
+        assert rgb[1] == 1.0 / 256.0
+        assert rgb[2] == 1.0 / 256.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 256.0
+        assert rgb[1] == 2.0 / 256.0
+        assert rgb[2] == 2.0 / 256.0
+        assert len(rgb) == 3
+
+    def test_get_rgb_float_image8(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(8))
+        rgb = data.get_rgb_float(0, 0)
+        assert rgb[0] == 0.00000000
+        assert rgb[1] == 0.00000000
+        assert rgb[2] == 0.00000000
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 4294967296.0
+        assert rgb[1] == 1.0 / 4294967296.0
+        assert rgb[2] == 1.0 / 4294967296.0
+        assert len(rgb) == 3
+
+        rgb = data.get_rgb_float(2, 0)
+        assert rgb[0] == 2.0 / 4294967296.0
+        assert rgb[1] == 2.0 / 4294967296.0
+        assert rgb[2] == 2.0 / 4294967296.0
+        assert len(rgb) == 3
+
+    def test_get_rgba_float_image1(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(1))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 1.0 / 65536.0
+        assert rgba[2] == 2.0 / 65536.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 65536.0
+        assert rgba[1] == 2.0 / 65536.0
+        assert rgba[2] == 3.0 / 65536.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 65536.0
+        assert rgba[1] == 3.0 / 65536.0
+        assert rgba[2] == 4.0 / 65536.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image2(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(2))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 1.0 / 256.0
+        assert rgba[2] == 2.0 / 256.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 256.0
+        assert rgba[1] == 2.0 / 256.0
+        assert rgba[2] == 3.0 / 256.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 256.0
+        assert rgba[1] == 3.0 / 256.0
+        assert rgba[2] == 4.0 / 256.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image3(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(3))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 1.0 / 65536.0
+        assert rgba[2] == 2.0 / 65536.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 65536.0
+        assert rgba[1] == 2.0 / 65536.0
+        assert rgba[2] == 3.0 / 65536.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 65536.0
+        assert rgba[1] == 3.0 / 65536.0
+        assert rgba[2] == 4.0 / 65536.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image4(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(4))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 1.0 / 256.0
+        assert rgba[2] == 2.0 / 256.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 256.0
+        assert rgba[1] == 2.0 / 256.0
+        assert rgba[2] == 3.0 / 256.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 256.0
+        assert rgba[1] == 3.0 / 256.0
+        assert rgba[2] == 4.0 / 256.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image5(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(5))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 0.00000000
+        assert rgba[2] == 0.00000000
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 65536.0
+        assert rgba[1] == 1.0 / 65536.0
+        assert rgba[2] == 1.0 / 65536.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 65536.0
+        assert rgba[1] == 2.0 / 65536.0
+        assert rgba[2] == 2.0 / 65536.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image6(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(6))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 0.00000000
+        assert rgba[2] == 0.00000000
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 4294967296.0
+        assert rgba[1] == 1.0 / 4294967296.0
+        assert rgba[2] == 1.0 / 4294967296.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 4294967296.0
+        assert rgba[1] == 2.0 / 4294967296.0
+        assert rgba[2] == 2.0 / 4294967296.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image7(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(7))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 0.00000000
+        assert rgba[2] == 0.00000000
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 256.0
+        assert rgba[1] == 1.0 / 256.0
+        assert rgba[2] == 1.0 / 256.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 256.0
+        assert rgba[1] == 2.0 / 256.0
+        assert rgba[2] == 2.0 / 256.0
+        assert len(rgba) == 4
+
+    def test_get_rgba_float_image8(self, full_isb: FileReadable1) -> None:
+        data = full_isb.image_data(ImageID(8))
+        rgba = data.get_rgba_float(0, 0)
+        assert rgba[0] == 0.00000000
+        assert rgba[1] == 0.00000000
+        assert rgba[2] == 0.00000000
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(1, 0)
+        assert rgba[0] == 1.0 / 4294967296.0
+        assert rgba[1] == 1.0 / 4294967296.0
+        assert rgba[2] == 1.0 / 4294967296.0
+        assert len(rgba) == 4
+
+        rgba = data.get_rgba_float(2, 0)
+        assert rgba[0] == 2.0 / 4294967296.0
+        assert rgba[1] == 2.0 / 4294967296.0
+        assert rgba[2] == 2.0 / 4294967296.0
+        assert len(rgba) == 4
+
+    def test_get_object_id(self, full_isb: FileReadable1) -> None:
+        for i in range(1, 9):
+            data = full_isb.image_data(ImageID(i))
+            if i == 8:
+                assert data.get_object_id(0, 0) == 0
+                assert data.get_object_id(1, 0) == 1
+                assert data.get_object_id(2, 0) == 2
+            else:
+                with pytest.raises(ValueError, match="Cannot fetch ob.*"):
+                    data.get_object_id(0, 0)
+
+    @pytest.mark.parametrize("image_id", range(1, 9))
+    def test_get_object_id_array(
+        self, full_isb: FileReadable1, image_id: int
+    ) -> None:
+        data = full_isb.image_data(ImageID(image_id))
+        if image_id != 8:
+            with pytest.raises(ValueError, match="Cannot fetch ob.*"):
+                data.get_object_id_array()
+            return
+
+        ids = data.get_object_id_array()
+        assert ids.shape == (16, 32)
+        assert ids.dtype == np.uint32
+        assert ids[0, 1] == 1
+        assert ids[15, 31] == 511
+        for x, y in _SAMPLES:
+            assert ids[y, x] == data.get_object_id(x, y)
+
+    def test_image_section_missing(self, full_isb: FileReadable1) -> None:
+        with pytest.raises(ValueError, match="No such image.*"):
+            full_isb.image_section(ImageID(9))
+
+    @pytest.mark.parametrize(("image_id", "first", "last", "scale"), _IMAGES)
+    def test_get_rgba_float_array(
+        self,
+        full_isb: FileReadable1,
+        image_id: int,
+        first: list[int],
+        last: list[int],
+        scale: float,
+    ) -> None:
+        data = full_isb.image_data(ImageID(image_id))
+        rgba = data.get_rgba_float_array()
+        assert rgba.shape == (16, 32, 4)
+        assert (rgba[0, 1] == np.array(first) / scale).all()
+        assert (rgba[15, 31] == np.array(last) / scale).all()
+        for x, y in _SAMPLES:
+            assert (rgba[y, x] == data.get_rgba_float(x, y)).all()
+
+    @pytest.mark.parametrize(("image_id", "first", "last", "scale"), _IMAGES)
+    def test_get_rgb_float_array(
+        self,
+        full_isb: FileReadable1,
+        image_id: int,
+        first: list[int],
+        last: list[int],
+        scale: float,
+    ) -> None:
+        data = full_isb.image_data(ImageID(image_id))
+        rgb = data.get_rgb_float_array()
+        assert rgb.shape == (16, 32, 3)
+        assert (rgb[0, 1] == np.array(first[0:3]) / scale).all()
+        assert (rgb[15, 31] == np.array(last[0:3]) / scale).all()
+        for x, y in _SAMPLES:
+            assert (rgb[y, x] == data.get_rgb_float(x, y)).all()
+
+    def test_open_read_preload(self) -> None:
+        with FileReadable1.open_file(
+            resource_file("full.isb"), preload=True
+        ) as f:
             data = f.image_data(ImageID(5))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 0.00000000
-            assert rgb[2] == 0.00000000
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 65536.0
-            assert rgb[1] == 1.0 / 65536.0
-            assert rgb[2] == 1.0 / 65536.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 65536.0
-            assert rgb[1] == 2.0 / 65536.0
-            assert rgb[2] == 2.0 / 65536.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image6(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(6))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 0.00000000
-            assert rgb[2] == 0.00000000
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 4294967296.0
-            assert rgb[1] == 1.0 / 4294967296.0
-            assert rgb[2] == 1.0 / 4294967296.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 4294967296.0
-            assert rgb[1] == 2.0 / 4294967296.0
-            assert rgb[2] == 2.0 / 4294967296.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image7(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(7))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 0.00000000
-            assert rgb[2] == 0.00000000
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 256.0
-            assert rgb[1] == 1.0 / 256.0
-            assert rgb[2] == 1.0 / 256.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 256.0
-            assert rgb[1] == 2.0 / 256.0
-            assert rgb[2] == 2.0 / 256.0
-            assert len(rgb) == 3
-
-    def test_get_rgb_float_image8(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(8))
-            rgb = data.get_rgb_float(0, 0)
-            assert rgb[0] == 0.00000000
-            assert rgb[1] == 0.00000000
-            assert rgb[2] == 0.00000000
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(1, 0)
-            assert rgb[0] == 1.0 / 4294967296.0
-            assert rgb[1] == 1.0 / 4294967296.0
-            assert rgb[2] == 1.0 / 4294967296.0
-            assert len(rgb) == 3
-
-            rgb = data.get_rgb_float(2, 0)
-            assert rgb[0] == 2.0 / 4294967296.0
-            assert rgb[1] == 2.0 / 4294967296.0
-            assert rgb[2] == 2.0 / 4294967296.0
-            assert len(rgb) == 3
-
-    def test_get_rgba_float_image1(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(1))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 1.0 / 65536.0
-            assert rgba[2] == 2.0 / 65536.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 65536.0
-            assert rgba[1] == 2.0 / 65536.0
-            assert rgba[2] == 3.0 / 65536.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 65536.0
-            assert rgba[1] == 3.0 / 65536.0
-            assert rgba[2] == 4.0 / 65536.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image2(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
+            assert data.get_rgb_float(1, 0)[0] == 1.0 / 65536.0
+
+    def test_manifest_cached(self, full_isb: FileReadable1) -> None:
+        section = full_isb.sections[0]
+        assert isinstance(section, FileReadableSection1Manifest)
+        assert section.manifest() is section.manifest()
+
+    def test_section_names(self, example_isb: FileReadable1) -> None:
+        names = [section.name for section in example_isb.sections]
+        assert names == ["MANIFEST", "IMAGE", "IMAGE", "IMAGE", "END"]
+
+    def test_open_read_bad_magic(self, tmpdir) -> None:
+        path = tmpdir + "/bad.isb"
+        with open(path, "wb") as f:
+            f.write(bytes(64))
+        with pytest.raises(ValueError, match="File magic number.*"):
+            FileReadable1.open_file(path)
+
+    def test_open_read_unvalidated(self) -> None:
+        with FileReadable1.open_file(
+            resource_file("full.isb"), validate=False
+        ) as f:
             data = f.image_data(ImageID(2))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 1.0 / 256.0
-            assert rgba[2] == 2.0 / 256.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 256.0
-            assert rgba[1] == 2.0 / 256.0
-            assert rgba[2] == 3.0 / 256.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 256.0
-            assert rgba[1] == 3.0 / 256.0
-            assert rgba[2] == 4.0 / 256.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image3(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(3))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 1.0 / 65536.0
-            assert rgba[2] == 2.0 / 65536.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 65536.0
-            assert rgba[1] == 2.0 / 65536.0
-            assert rgba[2] == 3.0 / 65536.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 65536.0
-            assert rgba[1] == 3.0 / 65536.0
-            assert rgba[2] == 4.0 / 65536.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image4(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(4))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 1.0 / 256.0
-            assert rgba[2] == 2.0 / 256.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 256.0
-            assert rgba[1] == 2.0 / 256.0
-            assert rgba[2] == 3.0 / 256.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 256.0
-            assert rgba[1] == 3.0 / 256.0
-            assert rgba[2] == 4.0 / 256.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image5(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(5))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 0.00000000
-            assert rgba[2] == 0.00000000
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 65536.0
-            assert rgba[1] == 1.0 / 65536.0
-            assert rgba[2] == 1.0 / 65536.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 65536.0
-            assert rgba[1] == 2.0 / 65536.0
-            assert rgba[2] == 2.0 / 65536.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image6(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(6))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 0.00000000
-            assert rgba[2] == 0.00000000
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 4294967296.0
-            assert rgba[1] == 1.0 / 4294967296.0
-            assert rgba[2] == 1.0 / 4294967296.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 4294967296.0
-            assert rgba[1] == 2.0 / 4294967296.0
-            assert rgba[2] == 2.0 / 4294967296.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image7(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(7))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 0.00000000
-            assert rgba[2] == 0.00000000
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 256.0
-            assert rgba[1] == 1.0 / 256.0
-            assert rgba[2] == 1.0 / 256.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 256.0
-            assert rgba[1] == 2.0 / 256.0
-            assert rgba[2] == 2.0 / 256.0
-            assert len(rgba) == 4
-
-    def test_get_rgba_float_image8(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            data = f.image_data(ImageID(8))
-            rgba = data.get_rgba_float(0, 0)
-            assert rgba[0] == 0.00000000
-            assert rgba[1] == 0.00000000
-            assert rgba[2] == 0.00000000
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(1, 0)
-            assert rgba[0] == 1.0 / 4294967296.0
-            assert rgba[1] == 1.0 / 4294967296.0
-            assert rgba[2] == 1.0 / 4294967296.0
-            assert len(rgba) == 4
-
-            rgba = data.get_rgba_float(2, 0)
-            assert rgba[0] == 2.0 / 4294967296.0
-            assert rgba[1] == 2.0 / 4294967296.0
-            assert rgba[2] == 2.0 / 4294967296.0
-            assert len(rgba) == 4
-
-    def test_get_object_id(self) -> None:
-        with FileReadable1.open_file(resource_file("full.isb")) as f:
-            for i in range(1, 9):
-                data = f.image_data(ImageID(i))
-                if i == 8:
-                    assert data.get_object_id(0, 0) == 0
-                    assert data.get_object_id(1, 0) == 1
-                    assert data.get_object_id(2, 0) == 2
-                else:
-                    with pytest.raises(ValueError, match="Cannot fetch ob.*"):
-                        data.get_object_id(0, 0)
+            assert data.get_rgb_float(1, 0)[0] == 1.0 / 256.0
+
+    def test_open_read_unvalidated_then_validated(self, tmpdir) -> None:
+        path = tmpdir + "/example-0.isb"
+        with open(resource_file("example-0.isb"), "rb") as f:
+            data = f.read().replace(b"manifest:1", b"manifest:2")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        with pytest.raises(XMLSyntaxError):
+            FileReadable1.open_file(path)
+
+        with FileReadable1.open_file(path, validate=False) as f:
+            section = f.sections[0]
+            assert isinstance(section, FileReadableSection1Manifest)
+            assert section.manifest(validate=False) is not None
+            with pytest.raises(XMLSyntaxError):
+                section.manifest(validate=True)
+
+    def test_image_survives_rewrite(self, tmpdir) -> None:
+        path = tmpdir + "/full.isb"
+        with open(resource_file("full.isb"), "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data)
+
+        with FileReadable1.open_file(path) as f:
+            manifest = f.sections[0].manifest()
+            image = f.image_data(ImageID(2))
+        assert f._map.closed  # noqa: SLF001
+
+        with FileWritable1.open_file(path, manifest):
+            pass
+        rgb = image.get_rgb_float(1, 0)
+        assert rgb[0] == 1.0 / 256.0
+        assert rgb[1] == 2.0 / 256.0
+        assert rgb[2] == 3.0 / 256.0
+
+    def test_advise_ignores_errors(self) -> None:
+        class FailingMap:
+            def __len__(self) -> int:
+                return 4096
+
+            def madvise(self, *_args: int) -> None:
+                raise OSError(errno.EAGAIN, "Resource temporarily unavailable")
+
+        _advise(FailingMap(), "MADV_RANDOM")  # type: ignore[arg-type]
@@ -14,9 +14,11 @@
 # IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
 
+import struct
+
 import pytest
 
-from ironsegment.model import ImageID, ObjectID
+from ironsegment.model import ImageID, ImageSemantic, ObjectID
 
 
 class TestObjectID:
@@ -49,3 +51,19 @@ class TestImageID:
 
     def test_object_id_3(self) -> None:
         ImageID(4294967295)
+
+
+class TestImageSemantic:
+    def test_semantic_values(self) -> None:
+        assert [int(s) for s in ImageSemantic] == list(range(8))
+        assert ImageSemantic(7) is ImageSemantic.OBJECT_ID_32
+
+    def test_semantic_int_equality(self) -> None:
+        assert ImageSemantic.DENOISE_RGB8 == 1
+        assert ImageSemantic.DEPTH_16 != ImageSemantic.DENOISE_RGB16
+        assert not ImageSemantic.DENOISE_RGB16
+        assert ImageSemantic.DENOISE_RGB8
+
+    def test_semantic_pack(self) -> None:
+        packed = struct.pack(">L", ImageSemantic.DEPTH_32)
+        assert ImageSemantic(struct.unpack(">L", packed)[0]).name == "DEPTH_32"
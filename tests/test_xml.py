@@ -14,7 +14,9 @@
 # IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from lxml.etree import XMLSyntaxError
@@ -27,9 +29,12 @@ from ironsegment.xml import (
     serialize_manifest,
 )
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
+
+@functools.cache
 def resource(name: str) -> bytes:
-    path = os.path.dirname(os.path.abspath(__file__)) + "/" + name
+    path = os.path.join(_HERE, name)
     with open(path, "rb") as f:
         return f.read()
 
@@ -58,6 +63,35 @@ class TestSchema:
         with pytest.raises(XMLSyntaxError):
             parse_manifest_text(resource("manifest-error3.xml"))
 
+    def test_parse_manifest_error_0(self) -> None:
+        for name in [
+            "manifest-error0.xml",
+            "manifest-error1.xml",
+            "manifest-error2.xml",
+            "manifest-error3.xml",
+        ]:
+            with pytest.raises(XMLSyntaxError):
+                parse_manifest(resource(name))
+
+    def test_parse_manifest_truncated(self) -> None:
+        with pytest.raises(XMLSyntaxError):
+            parse_manifest(resource("manifest0.xml")[0:300])
+
+    def test_parse_unvalidated(self) -> None:
+        tree = parse_manifest_text(
+            resource("manifest-error1.xml"), validate=False
+        )
+        assert len(tree[0]) == 3
+        manifest = parse_manifest(resource("manifest0.xml"), validate=False)
+        assert manifest.images.images[3].semantic == ImageSemantic.OBJECT_ID_32
+
+    def test_parse_threads(self) -> None:
+        text = resource("manifest0.xml")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            manifests = list(executor.map(parse_manifest, [text] * 8))
+        for manifest in manifests:
+            assert manifest.images.width == 1024
+
     def test_parse_ok_0(self) -> None:
         tree = parse_manifest_text(resource("manifest0.xml"))
         assert tree[0].tag == "{urn:com.io7m.ironsegment:manifest:1}Images"